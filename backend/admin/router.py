@@ -6,12 +6,15 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 
+from backend.core.cache import profile_cache
+from backend.analytics.pipeline import click_pipeline
 from backend.core.models import User
 from backend.core.exceptions import AdminRequiredError
 from backend.auth.router import get_current_user
 from backend.admin.schemas import (
     UserListResponse,
     StatsResponse,
+    MetricsResponse,
     PlanUpdateRequest,
     UserResponse
 )
@@ -48,6 +51,15 @@ async def get_stats(admin: User = Depends(get_admin_user)):
     return StatsResponse(data=stats)
 
 
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics(admin: User = Depends(get_admin_user)):
+    """캐시 등 런타임 지표 조회"""
+    return MetricsResponse(data={
+        "profile_cache": profile_cache.stats(),
+        "click_pipeline": click_pipeline.metrics(),
+    })
+
+
 @router.put("/users/{user_id}/plan", response_model=UserResponse)
 async def update_user_plan(
     user_id: UUID,
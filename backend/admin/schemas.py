@@ -2,7 +2,7 @@
 관리자 관련 Pydantic 스키마
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from backend.core.models import User, UserWithPlan, AdminStats, PlanType
@@ -21,6 +21,11 @@ class StatsResponse(BaseModel):
     data: AdminStats
 
 
+class MetricsResponse(BaseModel):
+    success: bool = True
+    data: Dict[str, Any]
+
+
 class PlanUpdateRequest(BaseModel):
     plan_type: PlanType
 
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from backend.core.cache import profile_cache
 from backend.core.database import db
 from backend.core.exceptions import UserNotFoundError, AdminRequiredError
 from backend.core.logger import get_logger
@@ -129,6 +130,7 @@ class AdminService:
         
         new_plan = await self._get_user_plan(user_id)
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"User plan updated: user_id={user_id}, plan={plan_type}")
         return UserWithPlan(**user.model_dump(), plan=new_plan)
     
@@ -0,0 +1,181 @@
+"""
+Click ingestion pipeline
+
+클릭 요청은 검증 후 프로세스 내 버퍼에 넣고 바로 응답하며,
+백그라운드 flusher 가 일정 주기(CLICK_FLUSH_INTERVAL_MS) 또는 일정 개수(CLICK_FLUSH_BATCH_SIZE)마다
+click_events 를 일괄 INSERT 하고 링크별 click_count 증가분을 모아서 반영한다.
+"""
+
+import asyncio
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID
+
+from backend.core.config import settings
+from backend.core.exceptions import ServiceUnavailableError
+from backend.core.logger import get_logger
+from backend.analytics.service import analytics_service
+from backend.links.service import link_service
+
+logger = get_logger(__name__)
+
+
+class ClickPipeline:
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 1000
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+        # metrics
+        self.enqueued_total = 0
+        self.rejected_total = 0
+        self.flushed_total = 0
+        self.failed_total = 0
+        self.flush_count = 0
+        self.last_batch_size = 0
+        self.last_flush_latency_ms = 0.0
+        self.max_flush_latency_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(
+        self,
+        link_id: UUID,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None
+    ) -> None:
+        """
+        클릭 이벤트를 버퍼에 추가
+
+        Raises:
+            ServiceUnavailableError: 버퍼가 가득 찬 경우 (backpressure)
+        """
+        if len(self._buffer) >= self.max_queue_size:
+            self.rejected_total += 1
+            raise ServiceUnavailableError(detail="Too many clicks in flight, please retry later")
+
+        self._buffer.append({
+            "link_id": str(link_id),
+            "clicked_at": datetime.utcnow().isoformat(),
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+        })
+        self.enqueued_total += 1
+
+        if self._wakeup is not None and len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="click-pipeline-flusher")
+        logger.info(
+            f"Click pipeline started: batch_size={self.batch_size}, "
+            f"flush_interval={self.flush_interval}s, max_queue_size={self.max_queue_size}"
+        )
+
+    async def stop(self) -> None:
+        """flusher 종료 후 남은 이벤트를 모두 반영 (drain-on-shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._buffer:
+            await self.flush()
+
+        self._wakeup = None
+        self._flush_lock = None
+        logger.info(f"Click pipeline stopped: flushed_total={self.flushed_total}")
+
+    async def flush(self) -> int:
+        """버퍼에서 최대 batch_size 개를 꺼내 DB에 반영하고 처리한 개수 반환"""
+        if self._flush_lock is None:
+            return await self._flush_batch()
+
+        async with self._flush_lock:
+            return await self._flush_batch()
+
+    async def _flush_batch(self) -> int:
+        batch: List[Dict[str, Any]] = []
+        while self._buffer and len(batch) < self.batch_size:
+            batch.append(self._buffer.popleft())
+
+        if not batch:
+            return 0
+
+        started = time.perf_counter()
+        deltas = Counter(event["link_id"] for event in batch)
+
+        try:
+            await link_service.increment_click_counts(dict(deltas))
+            await analytics_service.record_click_events(batch)
+            self.flushed_total += len(batch)
+        except Exception as e:
+            self.failed_total += len(batch)
+            logger.error(f"Click batch flush failed: size={len(batch)}, error={e}")
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.flush_count += 1
+        self.last_batch_size = len(batch)
+        self.last_flush_latency_ms = round(latency_ms, 2)
+        self.max_flush_latency_ms = round(max(self.max_flush_latency_ms, latency_ms), 2)
+        return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._buffer:
+                await self.flush()
+                if len(self._buffer) < self.batch_size:
+                    break
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "max_queue_size": self.max_queue_size,
+            "enqueued_total": self.enqueued_total,
+            "rejected_total": self.rejected_total,
+            "flushed_total": self.flushed_total,
+            "failed_total": self.failed_total,
+            "flush_count": self.flush_count,
+            "last_batch_size": self.last_batch_size,
+            "last_flush_latency_ms": self.last_flush_latency_ms,
+            "max_flush_latency_ms": self.max_flush_latency_ms,
+        }
+
+
+click_pipeline = ClickPipeline(
+    max_queue_size=settings.CLICK_QUEUE_MAX_SIZE,
+    batch_size=settings.CLICK_FLUSH_BATCH_SIZE,
+    flush_interval_ms=settings.CLICK_FLUSH_INTERVAL_MS
+)
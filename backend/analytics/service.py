@@ -7,7 +7,7 @@ from typing import List, Dict
 from uuid import UUID
 from collections import defaultdict
 
-from backend.core.database import db
+from backend.core.database import db, run_query
 from backend.core.logger import get_logger
 from backend.analytics.schemas import (
     LinkClickStats,
@@ -174,6 +174,18 @@ class AnalyticsService:
         except Exception as e:
             # click_events 테이블이 없어도 기존 click_count는 증가됨
             logger.warning(f"Failed to record click event: {e}")
+    
+    async def record_click_events(self, events: List[dict]) -> None:
+        """Bulk insert click events collected by the click pipeline"""
+        if not events:
+            return
+        
+        try:
+            await run_query(db.table(self.TABLE_CLICK_EVENTS).insert(events))
+            logger.info(f"Click events recorded: count={len(events)}")
+        except Exception as e:
+            # click_events 테이블이 없어도 click_count는 이미 반영됨
+            logger.warning(f"Failed to record click events: count={len(events)}, error={e}")
 
 
 analytics_service = AnalyticsService()
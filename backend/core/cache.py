@@ -0,0 +1,297 @@
+"""
+캐시 유틸리티
+TTL + LRU 인메모리 캐시와 플러그형 비동기 캐시 백엔드 (in-process / Redis 프로토콜)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from uuid import UUID
+
+from backend.core.config import settings
+from backend.core.logger import get_logger
+from backend.core.models import PublicProfile
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """스레드 안전한 TTL + LRU 캐시 (프로세스 로컬)"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CacheBackend:
+    """비동기 캐시 백엔드 인터페이스"""
+
+    # True면 값을 객체 그대로 저장, False면 문자열로 직렬화해서 저장
+    stores_objects: bool = True
+
+    async def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """프로세스 로컬 캐시 백엔드 (기본값)"""
+
+    stores_objects = True
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        self.cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.cache.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 프로토콜 캐시 백엔드 (멀티 워커 배포용)
+
+    redis.asyncio.Redis 와 같이 get / set(ex=) / delete / scan_iter 를 제공하는
+    비동기 클라이언트면 무엇이든 사용 가능
+    """
+
+    stores_objects = False
+
+    def __init__(self, client: Any, namespace: str = "ppoplink"):
+        self.client = client
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Any:
+        value = await self.client.get(self._key(key))
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        await self.client.set(self._key(key), value, ex=max(1, int(ttl)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self._key(key) for key in keys))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.namespace}:*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache_backend(max_entries: int, ttl_seconds: float) -> CacheBackend:
+    """설정(CACHE_BACKEND)에 따라 캐시 백엔드 생성"""
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("redis package is not installed, falling back to in-memory cache")
+        else:
+            if settings.REDIS_URL:
+                client = redis_asyncio.from_url(settings.REDIS_URL)
+                logger.info("Redis cache backend initialized")
+                return RedisCacheBackend(client)
+            logger.warning("REDIS_URL is not configured, falling back to in-memory cache")
+
+    return InMemoryCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+class ProfileCache:
+    """
+    공개 프로필 read-through 캐시
+
+    public_link_id → PublicProfile 을 저장하고, 쓰기 경로에서는 user_id 만 알기 때문에
+    user_id → public_link_id 역방향 인덱스도 함께 저장한다.
+    """
+
+    PROFILE_PREFIX = "public_profile:"
+    OWNER_PREFIX = "public_profile_owner:"
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    async def get(self, link_id: str) -> Optional[PublicProfile]:
+        if not self.enabled:
+            return None
+
+        try:
+            value = await self.backend.get(self.PROFILE_PREFIX + link_id)
+        except Exception as e:
+            logger.warning(f"Profile cache get failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if isinstance(value, PublicProfile):
+            return value
+        return PublicProfile.model_validate_json(value)
+
+    async def set(self, user_id: str, profile: PublicProfile) -> None:
+        if not self.enabled:
+            return
+
+        value = profile if self.backend.stores_objects else profile.model_dump_json()
+        try:
+            await self.backend.set(self.PROFILE_PREFIX + profile.public_link_id, value, self.ttl_seconds)
+            await self.backend.set(self.OWNER_PREFIX + str(user_id), profile.public_link_id, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Profile cache set failed: {e}")
+
+    async def invalidate(self, link_id: str) -> None:
+        try:
+            await self.backend.delete(self.PROFILE_PREFIX + link_id)
+            self.invalidations += 1
+        except Exception as e:
+            logger.warning(f"Profile cache invalidate failed: {e}")
+
+    async def invalidate_user(self, user_id: UUID | str) -> None:
+        """소유자의 쓰기 작업 후 호출 - 해당 사용자의 공개 프로필 캐시 삭제"""
+        if not self.enabled:
+            return
+
+        owner_key = self.OWNER_PREFIX + str(user_id)
+        try:
+            link_id = await self.backend.get(owner_key)
+            if link_id:
+                await self.backend.delete(self.PROFILE_PREFIX + link_id, owner_key)
+                self.invalidations += 1
+        except Exception as e:
+            logger.warning(f"Profile cache invalidate failed: user_id={user_id}, error={e}")
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            **{f"backend_{k}": v for k, v in self.backend.stats().items()},
+        }
+
+
+profile_cache = ProfileCache(
+    backend=create_cache_backend(
+        max_entries=settings.PROFILE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS
+    ),
+    ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS
+)
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_KEY: str
     SUPABASE_SERVICE_KEY: str = ""
+    DB_THREAD_POOL_SIZE: int = 16  # 블로킹 DB 호출을 실행할 스레드 수
+    # 공개 프로필 조회 방식: multi (테이블별 3회 조회), embedded (PostgREST 리소스 임베딩 1회),
+    # rpc (get_public_profile SQL 함수 1회, migrations/005 필요)
+    PUBLIC_PROFILE_QUERY_MODE: Literal["multi", "embedded", "rpc"] = "multi"
     
     # PPOP Auth (SSO)
     PPOP_AUTH_API_URL: str = ""  # https://auth-api.yourdomain.com
@@ -46,9 +50,20 @@ class Settings(BaseSettings):
     FREE_MAX_LINKS: int = 6
     FREE_MAX_SOCIAL_LINKS: int = 5
     
+    # Click Pipeline
+    CLICK_QUEUE_MAX_SIZE: int = 10000  # 버퍼가 가득 차면 503 반환 (backpressure)
+    CLICK_FLUSH_BATCH_SIZE: int = 500
+    CLICK_FLUSH_INTERVAL_MS: int = 1000
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     
+    # Cache
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"  # 멀티 워커 배포는 redis 권장
+    REDIS_URL: str = ""  # redis://localhost:6379/0
+    PROFILE_CACHE_TTL_SECONDS: int = 60  # 0이면 공개 프로필 캐시 비활성화
+    PROFILE_CACHE_MAX_ENTRIES: int = 10000
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """CORS 허용 오리진 목록"""
@@ -2,7 +2,9 @@
 Supabase 데이터베이스 연결 관리
 """
 
-from typing import Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 from supabase import create_client, Client
 
@@ -13,6 +15,7 @@ logger = get_logger(__name__)
 
 _supabase_client: Optional[Client] = None
 _supabase_admin_client: Optional[Client] = None
+_db_executor: Optional[ThreadPoolExecutor] = None
 
 
 def get_supabase_client() -> Client:
@@ -48,6 +51,29 @@ def get_supabase_admin_client() -> Client:
     return _supabase_admin_client
 
 
+def get_db_executor() -> ThreadPoolExecutor:
+    """블로킹 supabase-py 호출 전용 스레드 풀 (DB_THREAD_POOL_SIZE 로 크기 제한)"""
+    global _db_executor
+    
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=settings.DB_THREAD_POOL_SIZE,
+            thread_name_prefix="supabase-db"
+        )
+    
+    return _db_executor
+
+
+async def run_query(query: Any) -> Any:
+    """
+    쿼리 빌더의 execute()를 DB 스레드 풀에서 실행
+    
+    이벤트 루프를 막지 않으므로 asyncio.gather로 여러 쿼리를 동시에 실행할 수 있다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), query.execute)
+
+
 class SupabaseDB:
     """백엔드 서비스용 DB 클라이언트 - 서비스 롤 키 사용 (RLS 우회)"""
     def __init__(self):
@@ -63,6 +89,9 @@ class SupabaseDB:
     def table(self, name: str):
         return self.client.table(name)
     
+    def rpc(self, name: str, params: Optional[dict] = None):
+        return self.client.rpc(name, params or {})
+    
     @property
     def storage(self):
         return self.client.storage
@@ -125,6 +125,11 @@ class ExternalServiceError(BaseAppException):
     detail = "External service error"
 
 
+class ServiceUnavailableError(BaseAppException):
+    status_code = 503
+    detail = "Service temporarily unavailable"
+
+
 class ServiceNotFoundError(BaseAppException):
     status_code = 404
     detail = "Service code not found"
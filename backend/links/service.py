@@ -3,11 +3,12 @@
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
+from backend.core.cache import profile_cache
 from backend.core.config import settings
-from backend.core.database import db
+from backend.core.database import db, run_query
 from backend.core.exceptions import (
     LinkNotFoundError,
     LinkLimitExceededError,
@@ -66,6 +67,7 @@ class LinkService:
         
         result = db.table(self.TABLE_LINKS).insert(link_data).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Link created: user_id={user_id}, link_id={link_id}")
         return self._map_to_link(result.data[0])
     
@@ -95,6 +97,7 @@ class LinkService:
             "id", str(link_id)
         ).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Link updated: link_id={link_id}")
         
         # 업데이트된 데이터 조회 후 반환
@@ -107,6 +110,7 @@ class LinkService:
         
         db.table(self.TABLE_LINKS).delete().eq("id", str(link_id)).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Link deleted: link_id={link_id}")
     
     async def reorder_links(self, user_id: UUID, link_ids: List[UUID]) -> List[Link]:
@@ -116,20 +120,26 @@ class LinkService:
                 "updated_at": datetime.utcnow().isoformat()
             }).eq("id", str(link_id)).eq("user_id", str(user_id)).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Links reordered: user_id={user_id}")
         return await self.get_links(user_id)
     
-    async def increment_click_count(self, link_id: UUID) -> None:
+    async def increment_click_count(self, link_id: UUID, delta: int = 1) -> None:
         # Supabase에서는 RPC를 사용하거나 현재 값을 읽어서 증가
-        result = db.table(self.TABLE_LINKS).select("click_count").eq(
+        result = await run_query(db.table(self.TABLE_LINKS).select("click_count").eq(
             "id", str(link_id)
-        ).execute()
+        ))
         
         if result.data:
             current_count = result.data[0]["click_count"] or 0
-            db.table(self.TABLE_LINKS).update({
-                "click_count": current_count + 1
-            }).eq("id", str(link_id)).execute()
+            await run_query(db.table(self.TABLE_LINKS).update({
+                "click_count": current_count + delta
+            }).eq("id", str(link_id)))
+    
+    async def increment_click_counts(self, deltas: Dict[str, int]) -> None:
+        """링크별 클릭 수 증가분 반영 (link_id → 증가분)"""
+        for link_id, delta in deltas.items():
+            await self.increment_click_count(link_id, delta)
     
     # Social Link CRUD
     async def get_social_links(self, user_id: UUID) -> List[SocialLink]:
@@ -164,6 +174,7 @@ class LinkService:
         
         result = db.table(self.TABLE_SOCIAL_LINKS).insert(social_link_data).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Social link created: user_id={user_id}, platform={request.platform}")
         return self._map_to_social_link(result.data[0])
     
@@ -187,6 +198,7 @@ class LinkService:
             "id", str(social_link_id)
         ).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Social link updated: social_link_id={social_link_id}")
         
         # 업데이트된 데이터 조회 후 반환
@@ -199,6 +211,7 @@ class LinkService:
             "id", str(social_link_id)
         ).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Social link deleted: social_link_id={social_link_id}")
     
     # Helper methods
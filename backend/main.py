@@ -3,6 +3,8 @@ FastAPI 앱 진입점
 라우터 등록, 예외 핸들러 등록, 미들웨어 설정
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -19,6 +21,18 @@ from backend.links.router import router as links_router, social_router
 from backend.public.router import router as public_router
 from backend.admin.router import router as admin_router
 from backend.analytics.router import router as analytics_router
+from backend.analytics.pipeline import click_pipeline
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 백그라운드 작업 관리"""
+    await click_pipeline.start()
+    try:
+        yield
+    finally:
+        # 종료 시 버퍼에 남은 클릭을 모두 반영
+        await click_pipeline.stop()
 
 
 def create_app() -> FastAPI:
@@ -32,6 +46,7 @@ def create_app() -> FastAPI:
             version="0.1.0",
             docs_url=f"{settings.API_PREFIX}/docs" if settings.DEBUG else None,
             redoc_url=f"{settings.API_PREFIX}/redoc" if settings.DEBUG else None,
+            lifespan=lifespan,
         )
         
         logger.info("Setting up middlewares...")
@@ -8,6 +8,7 @@ from uuid import UUID
 
 from fastapi import UploadFile
 
+from backend.core.cache import profile_cache
 from backend.core.config import settings
 from backend.core.database import db
 from backend.core.exceptions import (
@@ -51,6 +52,7 @@ class ProfileService:
         if not result.data:
             raise UserNotFoundError()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Profile updated: user_id={user_id}")
         return self._map_to_user(result.data[0])
     
@@ -67,6 +69,7 @@ class ProfileService:
         if not result.data:
             raise UserNotFoundError()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Theme updated: user_id={user_id}")
         return self._map_to_user(result.data[0])
     
@@ -78,6 +81,7 @@ class ProfileService:
             "updated_at": datetime.utcnow().isoformat()
         }).eq("id", str(user_id)).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Profile image uploaded: user_id={user_id}")
         return url
     
@@ -96,6 +100,7 @@ class ProfileService:
             "updated_at": datetime.utcnow().isoformat()
         }).eq("id", str(user_id)).execute()
         
+        await profile_cache.invalidate_user(user_id)
         logger.info(f"Background image uploaded: user_id={user_id}")
         return url
     
@@ -24,7 +24,7 @@ async def get_public_profile(link_id: str):
     return PublicProfileResponse(data=profile)
 
 
-@router.post("/{public_link_id}/click/{link_id}", response_model=ClickResponse)
+@router.post("/{public_link_id}/click/{link_id}", response_model=ClickResponse, status_code=202)
 async def record_click(
     public_link_id: str, 
     link_id: UUID, 
@@ -32,7 +32,7 @@ async def record_click(
     user_agent: Optional[str] = Header(None)
 ):
     """
-    링크 클릭 기록
+    링크 클릭 기록 (접수 후 202 반환, DB 반영은 백그라운드에서 일괄 처리)
     
     Args:
         public_link_id: 암호화된 공개 링크 ID
@@ -14,5 +14,5 @@ class PublicProfileResponse(BaseModel):
 
 class ClickResponse(BaseModel):
     success: bool = True
-    message: str = "Click recorded"
+    message: str = "Click accepted"
 
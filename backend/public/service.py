@@ -2,15 +2,17 @@
 공개 페이지 서비스 로직
 """
 
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from backend.core.database import db
-from backend.core.exceptions import UserNotFoundError
+from backend.core.cache import profile_cache
+from backend.core.config import settings
+from backend.core.database import db, run_query
+from backend.core.exceptions import UserNotFoundError, LinkNotFoundError
 from backend.core.logger import get_logger
 from backend.core.models import PublicProfile, Link, SocialLink, SocialPlatform
-from backend.links.service import link_service
-from backend.analytics.service import analytics_service
+from backend.analytics.pipeline import click_pipeline
 from backend.auth.service import auth_service
 
 logger = get_logger(__name__)
@@ -28,31 +30,83 @@ class PublicService:
         Args:
             link_id: 암호화된 공개 링크 ID
         """
+        cached = await profile_cache.get(link_id)
+        if cached is not None:
+            return cached
+        
+        if settings.PUBLIC_PROFILE_QUERY_MODE == "multi":
+            user_data, links, social_links, is_pro_user = await self._fetch_profile_multi(link_id)
+        else:
+            user_data, links, social_links = await self._fetch_profile_single(link_id)
+            is_pro_user = await self._check_pro_user(user_data["id"])
+        
+        user_id = user_data["id"]  # PPOP Auth user_id와 동일
+        profile = self._build_public_profile(user_data, links, social_links, is_pro_user)
+        
+        await profile_cache.set(user_id, profile)
+        return profile
+    
+    async def _fetch_profile_multi(
+        self,
+        link_id: str
+    ) -> Tuple[dict, List[Link], List[SocialLink], bool]:
+        """사용자 조회 후 링크, 소셜 링크, 구독 상태를 동시에 조회 (multi 모드)"""
         # public_link_id로 사용자 조회
-        user_result = db.table(self.TABLE_USERS).select("*").eq(
+        user_result = await run_query(db.table(self.TABLE_USERS).select("*").eq(
             "public_link_id", link_id
-        ).eq("is_active", True).execute()
+        ).eq("is_active", True))
         
         if not user_result.data:
             raise UserNotFoundError(detail="Profile not found")
         
         user_data = user_result.data[0]
-        user_id = user_data["id"]  # PPOP Auth user_id와 동일
-        
-        # 활성화된 링크 조회
-        links = await self._get_active_links(user_id)
+        user_id = user_data["id"]
         
-        # 활성화된 소셜 링크 조회
-        social_links = await self._get_active_social_links(user_id)
+        # 활성 링크, 활성 소셜 링크, PRO 구독 상태를 동시에 조회
+        links, social_links, is_pro_user = await asyncio.gather(
+            self._get_active_links(user_id),
+            self._get_active_social_links(user_id),
+            self._check_pro_user(user_id),
+        )
+        return user_data, links, social_links, is_pro_user
+    
+    async def _fetch_profile_single(
+        self,
+        link_id: str
+    ) -> Tuple[dict, List[Link], List[SocialLink]]:
+        """사용자 + 활성 링크 + 활성 소셜 링크를 한 번의 요청으로 조회 (embedded / rpc 모드)"""
+        if settings.PUBLIC_PROFILE_QUERY_MODE == "rpc":
+            result = await run_query(db.rpc("get_public_profile", {"p_public_link_id": link_id}))
+            user_data = result.data
+        else:
+            result = await run_query(
+                db.table(self.TABLE_USERS).select(
+                    f"*,{self.TABLE_LINKS}(*),{self.TABLE_SOCIAL_LINKS}(*)"
+                ).eq("public_link_id", link_id).eq("is_active", True)
+                .eq(f"{self.TABLE_LINKS}.is_active", True)
+                .eq(f"{self.TABLE_SOCIAL_LINKS}.is_active", True)
+                .order("display_order", foreign_table=self.TABLE_LINKS)
+                .order("display_order", foreign_table=self.TABLE_SOCIAL_LINKS)
+            )
+            user_data = result.data[0] if result.data else None
         
-        # 프로필 소유자의 PRO 구독 상태 확인 (관리자 API 사용)
-        is_pro_user = False
-        try:
-            is_pro_user = await auth_service.check_user_subscription_by_user_id(user_id)
-        except Exception as e:
-            logger.warning(f"Failed to check subscription status for user {user_id}: {e}")
-            # 에러 발생 시 기본값 False 사용 (워터마크 표시)
+        if not user_data:
+            raise UserNotFoundError(detail="Profile not found")
         
+        links = [self._map_to_link(data) for data in user_data.get(self.TABLE_LINKS) or []]
+        social_links = [
+            self._map_to_social_link(data)
+            for data in user_data.get(self.TABLE_SOCIAL_LINKS) or []
+        ]
+        return user_data, links, social_links
+    
+    def _build_public_profile(
+        self,
+        user_data: dict,
+        links: List[Link],
+        social_links: List[SocialLink],
+        is_pro_user: bool
+    ) -> PublicProfile:
         return PublicProfile(
             public_link_id=user_data["public_link_id"],
             username=user_data["username"],
@@ -62,6 +116,7 @@ class PublicService:
             background_image_url=user_data.get("background_image_url"),
             background_color=user_data.get("background_color"),
             theme=user_data.get("theme", "default"),
+            button_style=user_data.get("button_style") or "default",
             links=links,
             social_links=social_links,
             is_pro_user=is_pro_user
@@ -75,44 +130,59 @@ class PublicService:
         ip_address: str = None
     ) -> None:
         """
-        링크 클릭 기록
+        링크 클릭 접수 (검증 후 클릭 파이프라인에 등록, DB 반영은 백그라운드에서 일괄 처리)
         
         Args:
             public_link_id: 암호화된 공개 링크 ID
             link_id: 클릭된 링크의 UUID
             user_agent: 클라이언트 User-Agent
             ip_address: 클라이언트 IP 주소
+            
+        Raises:
+            UserNotFoundError: 프로필이 없음
+            LinkNotFoundError: 캐시된 프로필에 해당 링크가 없음
+            ServiceUnavailableError: 클릭 버퍼가 가득 참
         """
-        # 사용자 확인 (public_link_id로 조회)
-        user_result = db.table(self.TABLE_USERS).select("id").eq(
-            "public_link_id", public_link_id
-        ).execute()
-        
-        if not user_result.data:
-            raise UserNotFoundError(detail="Profile not found")
-        
-        # 클릭 수 증가 (links 테이블)
-        await link_service.increment_click_count(link_id)
+        cached = await profile_cache.get(public_link_id)
+        if cached is not None:
+            # 캐시된 프로필이 있으면 DB 조회 없이 검증
+            if not any(link.id == link_id for link in cached.links):
+                raise LinkNotFoundError()
+        else:
+            # 사용자 확인 (public_link_id로 조회)
+            user_result = await run_query(db.table(self.TABLE_USERS).select("id").eq(
+                "public_link_id", public_link_id
+            ))
+            
+            if not user_result.data:
+                raise UserNotFoundError(detail="Profile not found")
         
-        # 상세 클릭 이벤트 기록 (analytics 테이블)
-        await analytics_service.record_click_event(link_id, user_agent, ip_address)
-        
-        logger.info(f"Click recorded: public_link_id={public_link_id}, link_id={link_id}")
+        click_pipeline.enqueue(link_id, user_agent=user_agent, ip_address=ip_address)
+        logger.debug(f"Click accepted: public_link_id={public_link_id}, link_id={link_id}")
     
     async def _get_active_links(self, user_id: str) -> List[Link]:
-        result = db.table(self.TABLE_LINKS).select("*").eq(
+        result = await run_query(db.table(self.TABLE_LINKS).select("*").eq(
             "user_id", user_id
-        ).eq("is_active", True).order("display_order").execute()
+        ).eq("is_active", True).order("display_order"))
         
         return [self._map_to_link(data) for data in result.data]
     
     async def _get_active_social_links(self, user_id: str) -> List[SocialLink]:
-        result = db.table(self.TABLE_SOCIAL_LINKS).select("*").eq(
+        result = await run_query(db.table(self.TABLE_SOCIAL_LINKS).select("*").eq(
             "user_id", user_id
-        ).eq("is_active", True).order("display_order").execute()
+        ).eq("is_active", True).order("display_order"))
         
         return [self._map_to_social_link(data) for data in result.data]
     
+    async def _check_pro_user(self, user_id: str) -> bool:
+        """프로필 소유자의 PRO 구독 상태 확인 (관리자 API 사용)"""
+        try:
+            return await auth_service.check_user_subscription_by_user_id(user_id)
+        except Exception as e:
+            logger.warning(f"Failed to check subscription status for user {user_id}: {e}")
+            # 에러 발생 시 기본값 False 사용 (워터마크 표시)
+            return False
+    
     def _map_to_link(self, data: dict) -> Link:
         return Link(
             id=data["id"],
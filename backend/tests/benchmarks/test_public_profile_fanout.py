@@ -0,0 +1,95 @@
+"""
+공개 프로필 하위 쿼리 동시 실행 벤치마크
+
+지연 주입 DB(쿼리당 LATENCY)와 동일 지연의 구독 확인을 사용해
+순차 실행(변경 전)과 asyncio.gather 동시 실행(변경 후)의 p50/p99 를 비교한다.
+
+    pytest backend/tests/benchmarks/test_public_profile_fanout.py -s
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.public.service import public_service
+from backend.tests.benchmarks.helpers import summarize
+from backend.tests.fakes import FakeSupabase
+
+LATENCY = 0.01
+ITERATIONS = 20
+USER_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def build_db() -> FakeSupabase:
+    return FakeSupabase(
+        tables={
+            "users": [{
+                "id": USER_ID,
+                "public_link_id": "abc123",
+                "username": "testuser",
+                "is_active": True,
+            }],
+            "links": [{
+                "id": f"00000000-0000-0000-0000-{i:012d}",
+                "user_id": USER_ID,
+                "title": f"Link {i}",
+                "url": "https://example.com",
+                "display_order": i,
+                "is_active": True,
+                "created_at": "2024-01-01T00:00:00",
+            } for i in range(10)],
+            "social_links": [{
+                "id": "10000000-0000-0000-0000-000000000000",
+                "user_id": USER_ID,
+                "platform": "github",
+                "url": "https://github.com/test",
+                "display_order": 0,
+                "is_active": True,
+                "created_at": "2024-01-01T00:00:00",
+            }],
+        },
+        latency=LATENCY,
+    )
+
+
+async def slow_subscription_check(user_id: str) -> bool:
+    await asyncio.sleep(LATENCY)
+    return False
+
+
+async def sequential_profile(fake_db: FakeSupabase, link_id: str) -> None:
+    """변경 전 구현: 블로킹 호출을 이벤트 루프에서 순서대로 실행"""
+    user = fake_db.table("users").select("*").eq("public_link_id", link_id).execute().data[0]
+    fake_db.table("links").select("*").eq("user_id", user["id"]).eq("is_active", True).execute()
+    fake_db.table("social_links").select("*").eq("user_id", user["id"]).eq("is_active", True).execute()
+    await slow_subscription_check(user["id"])
+
+
+async def measure(call) -> list:
+    samples = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_public_profile_fanout_latency():
+    fake_db = build_db()
+
+    with patch("backend.public.service.db", fake_db), \
+         patch("backend.public.service.profile_cache.ttl_seconds", 0), \
+         patch("backend.public.service.auth_service.check_user_subscription_by_user_id", slow_subscription_check):
+        before = summarize(await measure(lambda: sequential_profile(fake_db, "abc123")))
+        after = summarize(await measure(lambda: public_service.get_public_profile("abc123")))
+
+    print(f"\npublic profile latency (per-leg {LATENCY * 1000:.0f}ms)")
+    print(f"  sequential: {before}")
+    print(f"  fan-out:    {after}")
+
+    # 사용자 조회 1회 + 세 하위 쿼리 중 최댓값 ≈ 2 * LATENCY (순차 실행은 4 * LATENCY)
+    assert after["p50_ms"] < before["p50_ms"] * 0.75
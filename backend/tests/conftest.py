@@ -2,6 +2,7 @@
 Pytest configuration and fixtures
 """
 
+import asyncio
 import os
 import pytest
 from typing import Generator
@@ -30,6 +31,15 @@ def test_app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """테스트 간 캐시 상태 공유 방지"""
+    from backend.core.cache import profile_cache
+    asyncio.run(profile_cache.clear())
+    profile_cache.reset_stats()
+    yield
+
+
 @pytest.fixture
 def client(test_app) -> Generator:
     """Create test client"""
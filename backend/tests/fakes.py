@@ -0,0 +1,142 @@
+"""
+테스트용 인메모리 Supabase 대체 구현
+지연 주입과 왕복 횟수 기록을 지원한다
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+
+class FakeQuery:
+    """postgrest 쿼리 빌더의 체이닝 API 일부를 흉내내는 쿼리"""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table_name = table
+        self.op = "select"
+        self.payload: Any = None
+        self.filters: List[Callable[[dict], bool]] = []
+        self.order_by: List[tuple] = []
+        self.limit_count: Optional[int] = None
+        self.offset = 0
+        self.count_mode: Optional[str] = None
+
+    # 쿼리 종류
+    def select(self, *columns, count: Optional[str] = None):
+        self.count_mode = count
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, **kwargs):
+        self.op, self.payload = "upsert", rows
+        return self
+
+    def update(self, data):
+        self.op, self.payload = "update", data
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    # 필터
+    def eq(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) == str(value))
+        return self
+
+    def in_(self, column, values):
+        values = {str(v) for v in values}
+        self.filters.append(lambda row: str(row.get(column)) in values)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) >= str(value))
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) < str(value))
+        return self
+
+    def order(self, column, desc: bool = False, **kwargs):
+        self.order_by.append((column, desc))
+        return self
+
+    def limit(self, count, **kwargs):
+        self.limit_count = count
+        return self
+
+    def range(self, start, end):
+        self.offset, self.limit_count = start, end - start + 1
+        return self
+
+    def execute(self):
+        return self.db._execute(self)
+
+
+class FakeSupabase:
+    """
+    지연 주입 인메모리 Supabase 클라이언트
+
+    execute()/rpc 호출마다 latency 초 동안 블로킹(time.sleep)하여 실제 네트워크 왕복을 흉내내고,
+    호출 횟수를 round_trips 로 기록한다.
+    """
+
+    def __init__(self, tables: Optional[Dict[str, List[dict]]] = None, latency: float = 0.0):
+        self.tables: Dict[str, List[dict]] = tables or {}
+        self.latency = latency
+        self.round_trips = 0
+        self.rpc_handlers: Dict[str, Callable[[dict], Any]] = {}
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[dict] = None):
+        handler = self.rpc_handlers[name]
+
+        def execute():
+            self._round_trip()
+            with self._lock:
+                return SimpleNamespace(data=handler(params or {}), count=None)
+
+        return SimpleNamespace(execute=execute)
+
+    def _round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _execute(self, query: FakeQuery):
+        self._round_trip()
+        with self._lock:
+            rows = self.tables.setdefault(query.table_name, [])
+
+            if query.op in ("insert", "upsert"):
+                new_rows = query.payload if isinstance(query.payload, list) else [query.payload]
+                new_rows = [dict(row) for row in new_rows]
+                rows.extend(new_rows)
+                return SimpleNamespace(data=new_rows, count=None)
+
+            matched = [row for row in rows if all(f(row) for f in query.filters)]
+
+            if query.op == "update":
+                for row in matched:
+                    row.update(query.payload)
+                return SimpleNamespace(data=[dict(row) for row in matched], count=None)
+
+            if query.op == "delete":
+                self.tables[query.table_name] = [row for row in rows if row not in matched]
+                return SimpleNamespace(data=matched, count=None)
+
+            for column, desc in reversed(query.order_by):
+                matched.sort(key=lambda row: row.get(column) or 0, reverse=desc)
+            count = len(matched) if query.count_mode else None
+            end = None if query.limit_count is None else query.offset + query.limit_count
+            data = [dict(row) for row in matched[query.offset:end]]
+            return SimpleNamespace(data=data, count=count)
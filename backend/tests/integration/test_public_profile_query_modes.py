@@ -0,0 +1,110 @@
+"""
+공개 프로필 조회 방식(multi / embedded / rpc) 결과 일치 테스트
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.public.service import public_service
+from backend.tests.fakes import FakeSupabase
+
+USER_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.fixture
+def tables():
+    user = {
+        "id": USER_ID,
+        "public_link_id": "abc123",
+        "username": "testuser",
+        "email": "test@example.com",
+        "display_name": "Test User",
+        "bio": "bio",
+        "background_color": "#ffffff",
+        "theme": "dark",
+        "button_style": "outline",
+        "is_active": True,
+        "created_at": "2024-01-01T00:00:00",
+    }
+    links = [{
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "user_id": USER_ID,
+        "title": f"Link {i}",
+        "url": f"https://example.com/{i}",
+        "display_order": order,
+        "is_active": i != 2,
+        "click_count": i * 10,
+        "created_at": "2024-01-01T00:00:00",
+    } for i, order in enumerate([3, 1, 0, 2])]
+    social_links = [{
+        "id": f"10000000-0000-0000-0000-{i:012d}",
+        "user_id": USER_ID,
+        "platform": platform,
+        "url": f"https://{platform}.com/test",
+        "display_order": 1 - i,
+        "is_active": True,
+        "created_at": "2024-01-01T00:00:00",
+    } for i, platform in enumerate(["github", "youtube"])]
+    return {"users": [user], "links": links, "social_links": social_links}
+
+
+def compose_single_row(tables) -> dict:
+    """embedded select / get_public_profile RPC 가 반환하는 형태로 조합"""
+    def active_sorted(rows):
+        return sorted((r for r in rows if r["is_active"]), key=lambda r: r["display_order"])
+
+    return {
+        **tables["users"][0],
+        "links": active_sorted(tables["links"]),
+        "social_links": active_sorted(tables["social_links"]),
+    }
+
+
+async def load_profile(mode: str, db) -> object:
+    with patch("backend.public.service.db", db), \
+         patch("backend.public.service.settings.PUBLIC_PROFILE_QUERY_MODE", mode), \
+         patch("backend.public.service.profile_cache.ttl_seconds", 0), \
+         patch("backend.public.service.auth_service.check_user_subscription_by_user_id", new_callable=AsyncMock, return_value=True):
+        return await public_service.get_public_profile("abc123")
+
+
+@pytest.mark.asyncio
+async def test_single_query_modes_match_multi_query(tables):
+    multi_db = FakeSupabase(tables=tables)
+    expected = await load_profile("multi", multi_db)
+    assert multi_db.round_trips == 3
+    assert [link.title for link in expected.links] == ["Link 1", "Link 3", "Link 0"]
+    assert expected.button_style == "outline"
+
+    # embedded: users 조회 1회에 links / social_links 가 포함된 응답
+    embedded_db = MagicMock()
+    embedded_query = MagicMock()
+    embedded_db.table.return_value = embedded_query
+    for method in ("select", "eq", "order"):
+        getattr(embedded_query, method).return_value = embedded_query
+    embedded_query.execute.return_value = MagicMock(data=[compose_single_row(tables)])
+
+    embedded = await load_profile("embedded", embedded_db)
+    assert embedded == expected
+    assert embedded_query.execute.call_count == 1
+    embedded_query.select.assert_called_once_with("*,links(*),social_links(*)")
+
+    # rpc: get_public_profile 함수가 단일 JSON 객체를 반환
+    rpc_db = FakeSupabase()
+    rpc_db.rpc_handlers["get_public_profile"] = lambda params: (
+        compose_single_row(tables) if params["p_public_link_id"] == "abc123" else None
+    )
+    via_rpc = await load_profile("rpc", rpc_db)
+    assert via_rpc == expected
+    assert rpc_db.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_single_query_mode_raises_not_found():
+    from backend.core.exceptions import UserNotFoundError
+
+    rpc_db = FakeSupabase()
+    rpc_db.rpc_handlers["get_public_profile"] = lambda params: None
+
+    with pytest.raises(UserNotFoundError):
+        await load_profile("rpc", rpc_db)
@@ -0,0 +1,155 @@
+"""
+Unit tests for cache utilities and public profile cache
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+from backend.core.cache import (
+    TTLCache,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    ProfileCache,
+)
+from backend.core.models import PublicProfile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """redis.asyncio.Redis 로컬 대체 구현 (get/set/delete/scan_iter)"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    async def get(self, key):
+        value = self.store.get(key)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.expiry[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def scan_iter(self, match=None):
+        prefix = match.rstrip("*") if match else ""
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+
+@pytest.fixture
+def sample_profile():
+    return PublicProfile(public_link_id="abc123", username="testuser", display_name="Test User")
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    def test_get_returns_value_until_expired(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction_keeps_recently_used(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_zero_ttl_disables_storage(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+@pytest.mark.unit
+class TestProfileCache:
+    @pytest.mark.asyncio
+    async def test_in_memory_hit_and_invalidate_user(self, sample_profile):
+        cache = ProfileCache(InMemoryCacheBackend(max_entries=10, ttl_seconds=60), ttl_seconds=60)
+        user_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+        assert await cache.get("abc123") is None
+        await cache.set(str(user_id), sample_profile)
+        assert await cache.get("abc123") is sample_profile
+
+        await cache.invalidate_user(user_id)
+        assert await cache.get("abc123") is None
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert cache.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_round_trips_json(self, sample_profile):
+        redis = FakeRedis()
+        cache = ProfileCache(RedisCacheBackend(redis), ttl_seconds=30)
+
+        await cache.set("user-1", sample_profile)
+        assert redis.expiry["ppoplink:public_profile:abc123"] == 30
+
+        cached = await cache.get("abc123")
+        assert cached == sample_profile
+
+        await cache.invalidate_user("user-1")
+        assert await cache.get("abc123") is None
+        assert "ppoplink:public_profile_owner:user-1" not in redis.store
+
+
+@pytest.mark.asyncio
+async def test_public_profile_served_from_cache_and_invalidated_by_link_write(sample_user_data):
+    """두 번째 조회는 DB를 타지 않고, 링크 수정 후에는 다시 DB에서 조회"""
+    from backend.public.service import public_service
+    from backend.links.service import link_service
+    from backend.links.schemas import LinkUpdateRequest
+
+    with patch("backend.public.service.db") as mock_db:
+        mock_table = MagicMock()
+        mock_db.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.execute.return_value = MagicMock(data=[sample_user_data])
+
+        with patch.object(public_service, "_get_active_links", new_callable=AsyncMock, return_value=[]), \
+             patch.object(public_service, "_get_active_social_links", new_callable=AsyncMock, return_value=[]), \
+             patch("backend.public.service.auth_service.check_user_subscription_by_user_id", new_callable=AsyncMock, return_value=False):
+            first = await public_service.get_public_profile("abc123")
+            second = await public_service.get_public_profile("abc123")
+
+            assert second == first
+            assert mock_db.table.call_count == 1
+
+            link_id = UUID("223e4567-e89b-12d3-a456-426614174000")
+            with patch.object(link_service, "_verify_link_ownership", new_callable=AsyncMock), \
+                 patch.object(link_service, "_get_link_by_id", new_callable=AsyncMock), \
+                 patch("backend.links.service.db"):
+                await link_service.update_link(
+                    UUID(sample_user_data["id"]), link_id, LinkUpdateRequest(title="New")
+                )
+
+            await public_service.get_public_profile("abc123")
+            assert mock_db.table.call_count == 2
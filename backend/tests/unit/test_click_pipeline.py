@@ -0,0 +1,97 @@
+"""
+Unit tests for the click ingestion pipeline
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+from backend.analytics.pipeline import ClickPipeline
+from backend.core.exceptions import ServiceUnavailableError
+
+LINK_A = UUID("223e4567-e89b-12d3-a456-426614174000")
+LINK_B = UUID("323e4567-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def sinks():
+    with patch("backend.analytics.pipeline.link_service.increment_click_counts", new_callable=AsyncMock) as counts, \
+         patch("backend.analytics.pipeline.analytics_service.record_click_events", new_callable=AsyncMock) as events:
+        yield counts, events
+
+
+@pytest.mark.unit
+class TestClickPipeline:
+    @pytest.mark.asyncio
+    async def test_flush_aggregates_deltas_and_bulk_inserts(self, sinks):
+        counts, events = sinks
+        pipeline = ClickPipeline(max_queue_size=100, batch_size=50)
+
+        for _ in range(3):
+            pipeline.enqueue(LINK_A, user_agent="ua", ip_address="127.0.0.1")
+        pipeline.enqueue(LINK_B)
+
+        assert await pipeline.flush() == 4
+        counts.assert_awaited_once_with({str(LINK_A): 3, str(LINK_B): 1})
+        events.assert_awaited_once()
+        assert len(events.await_args.args[0]) == 4
+        assert pipeline.queue_depth == 0
+        assert pipeline.metrics()["flushed_total"] == 4
+
+    def test_enqueue_rejects_when_buffer_full(self):
+        pipeline = ClickPipeline(max_queue_size=2)
+        pipeline.enqueue(LINK_A)
+        pipeline.enqueue(LINK_A)
+
+        with pytest.raises(ServiceUnavailableError):
+            pipeline.enqueue(LINK_A)
+        assert pipeline.metrics()["rejected_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_flush_and_stop_drains(self, sinks):
+        counts, events = sinks
+        pipeline = ClickPipeline(max_queue_size=100, batch_size=5, flush_interval_ms=60_000)
+        await pipeline.start()
+
+        for _ in range(5):
+            pipeline.enqueue(LINK_A)
+        await asyncio.sleep(0.05)
+        assert pipeline.flushed_total == 5
+
+        for _ in range(7):
+            pipeline.enqueue(LINK_B)
+        await pipeline.stop()
+
+        assert pipeline.queue_depth == 0
+        assert pipeline.flushed_total == 12
+        assert not pipeline.running
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_counted(self, sinks):
+        counts, _ = sinks
+        counts.side_effect = Exception("db down")
+        pipeline = ClickPipeline()
+        pipeline.enqueue(LINK_A)
+
+        await pipeline.flush()
+        assert pipeline.failed_total == 1
+        assert pipeline.flushed_total == 0
+
+
+def test_click_endpoint_returns_202_and_enqueues(client, sinks):
+    from backend.analytics.pipeline import click_pipeline
+
+    with patch("backend.public.service.db") as mock_db:
+        mock_table = MagicMock()
+        mock_db.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.execute.return_value = MagicMock(data=[{"id": "123e4567-e89b-12d3-a456-426614174000"}])
+
+        before = click_pipeline.enqueued_total
+        response = client.post(f"/api/public/abc123/click/{LINK_A}")
+
+    assert response.status_code == 202
+    assert response.json()["success"] is True
+    assert click_pipeline.enqueued_total == before + 1
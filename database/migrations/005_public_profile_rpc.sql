@@ -0,0 +1,28 @@
+-- 공개 프로필 단일 조회 RPC
+-- users + 활성 links + 활성 social_links 를 한 번의 요청으로 반환 (PUBLIC_PROFILE_QUERY_MODE=rpc)
+-- 반환 형식: users 행 + "links", "social_links" 배열 (display_order 순), 프로필이 없으면 NULL
+
+CREATE OR REPLACE FUNCTION get_public_profile(p_public_link_id TEXT)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT (to_jsonb(u) - 'password_hash' - 'email') || jsonb_build_object(
+        'links', COALESCE((
+            SELECT jsonb_agg(to_jsonb(l) ORDER BY l.display_order)
+            FROM links l
+            WHERE l.user_id = u.id AND l.is_active = TRUE
+        ), '[]'::jsonb),
+        'social_links', COALESCE((
+            SELECT jsonb_agg(to_jsonb(s) ORDER BY s.display_order)
+            FROM social_links s
+            WHERE s.user_id = u.id AND s.is_active = TRUE
+        ), '[]'::jsonb)
+    )
+    FROM users u
+    WHERE u.public_link_id = p_public_link_id
+      AND u.is_active = TRUE
+$$;
+
+-- 확인
+-- SELECT get_public_profile('Ab3x2Kq9');